@@ -14,19 +14,56 @@ References:
 """
 
 import os
+import atexit
+import asyncio
 import sys
 import json
-import yaml
+import mmap
 import logging
+import logging.handlers
+import queue
 import subprocess
-import requests
 import tempfile
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from string import Template
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the stdlib json encoder does not handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+if orjson is not None:
+    def _dumps(obj: Any, indent: bool = True) -> bytes:
+        """Serialize obj to JSON bytes, indented unless indent is False."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    
+    def _loads(data: memoryview) -> Any:
+        """Deserialize JSON directly from a bytes-like buffer."""
+        return orjson.loads(data)
+else:
+    def _dumps(obj: Any, indent: bool = True) -> bytes:
+        """Serialize obj to JSON bytes, indented unless indent is False."""
+        if indent:
+            return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':'), default=_json_default).encode('utf-8')
+    
+    def _loads(data: memoryview) -> Any:
+        """Deserialize JSON from a bytes-like buffer."""
+        return json.loads(bytes(data))
+
 # Configuration Constants
 CONFIG = {
     "PORTS": {
@@ -53,7 +90,136 @@ CONFIG = {
     }
 }
 
-@dataclass
+# Flattened URL and port constants; CONFIG is never mutated after import
+MOBILE_DASHBOARD_URL = CONFIG["URLS"]["MOBILE_DASHBOARD"]
+API_ENDPOINTS_URL = CONFIG["URLS"]["API_ENDPOINTS"]
+MONITORING_URL = CONFIG["URLS"]["MONITORING"]
+RESEARCH_URL = CONFIG["URLS"]["RESEARCH"]
+GITHUB_URL = CONFIG["URLS"]["GITHUB"]
+MOBILE_DASHBOARD_PORT = CONFIG["PORTS"]["MOBILE_DASHBOARD"]
+
+# Static file templates rendered into the main repository
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Substitutions shared by the templates in TEMPLATES_DIR
+_TEMPLATE_VARS = {
+    "mobile_dashboard_url": MOBILE_DASHBOARD_URL,
+    "api_endpoints_url": API_ENDPOINTS_URL,
+    "monitoring_url": MONITORING_URL,
+    "research_url": RESEARCH_URL,
+    "github_url": GITHUB_URL,
+    "mobile_dashboard_port": MOBILE_DASHBOARD_PORT
+}
+
+# Recommended subdirectory structure of the main repository
+SUBDIRECTORIES = {
+    "core/": "Core autonomous venture studio components",
+    "businesses/": "Business entity implementations and configurations",
+    "integrations/": "External system integrations and APIs",
+    "dashboards/": "Monitoring and control dashboards",
+    "research/": "Research processing components and data",
+    "mobile/": "Mobile-specific optimizations and configurations",
+    "api/": "REST API endpoints and services",
+    "docs/": "Documentation and setup guides",
+    "scripts/": "Automation and deployment scripts",
+    "config/": "Configuration files and settings",
+    "data/": "Data storage and processing",
+    "logs/": "System logs and monitoring data"
+}
+
+# Additional directories the file helpers write into
+EXTRA_DIRECTORIES = ("templates/",)
+
+# Mobile setup instructions, rendered once per manager instance
+_INSTRUCTIONS_TEMPLATE = Template("""# Mobile Access Setup Instructions
+
+## Autonomous Venture Studio - IZA OS Ecosystem
+
+### Quick Setup (Mobile)
+
+1. **Clone Repository**
+   ```bash
+   git clone https://github.com/${github_username}/${main_repo_name}.git
+   cd ${main_repo_name}
+   ```
+
+2. **Install Dependencies**
+   ```bash
+   pip install -r requirements.txt
+   ```
+
+3. **Run Mobile Setup**
+   ```bash
+   chmod +x mobile_setup.sh
+   ./mobile_setup.sh
+   ```
+
+4. **Access Mobile Dashboard**
+   - Open http://localhost:8000 in your mobile browser
+   - All features optimized for mobile access
+
+### Mobile Access Points
+
+- **Main Dashboard**: ${mobile_dashboard_url}
+- **API Endpoints**: ${api_endpoints_url}
+- **Monitoring**: ${monitoring_url}
+- **Research**: ${research_url}
+- **GitHub Integration**: ${github_url}
+
+### Mobile Features
+
+✅ Responsive design for all screen sizes  
+✅ Touch-friendly interface  
+✅ Offline functionality  
+✅ Push notifications  
+✅ Mobile-optimized API  
+✅ Compressed data transfer  
+✅ Mobile caching  
+
+### Ecosystem Overview
+
+- **Total Value**: $$724M+
+- **Entities**: 730+
+- **Automation**: 95%
+- **Revenue Potential**: $$300M ARR
+- **Mobile Ready**: ✅
+
+### Support
+
+For mobile access support, see `docs/mobile_setup.md`
+
+---
+**Mobile Access Enabled** ✅
+""")
+
+# Per-subdirectory README, formatted with title, description and dir_name
+_SUBDIR_README_TMPL = """# {title}
+
+{description}
+
+## Mobile Access
+
+This directory is optimized for mobile access and remote management.
+
+## Quick Start
+
+```bash
+# Navigate to this directory
+cd {dir_name}
+
+# View available files
+ls -la
+```
+
+## Mobile Optimization
+
+- Compressed file formats
+- Optimized for mobile viewing
+- Remote access enabled
+- Mobile-friendly documentation
+"""
+
+@dataclass(slots=True, frozen=True)
 class MobileRepository:
     """Mobile repository configuration."""
     name: str
@@ -63,9 +229,139 @@ class MobileRepository:
     local_path: str
     status: str = "pending"
 
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that joins pending records into a single stream write.
+    
+    Records are flushed once buffer_size characters are pending, when the
+    queue listener drains, or at logging shutdown.
+    """
+    
+    def __init__(self, stream=None, buffer_size: int = 65536):
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self._pending: List[str] = []
+        self._pending_size = 0
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending.append(msg)
+        self._pending_size += len(msg)
+        if self._pending_size >= self.buffer_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._pending:
+                self.stream.write("".join(self._pending))
+                self._pending.clear()
+                self._pending_size = 0
+            super().flush()
+        finally:
+            self.release()
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes buffered stream handlers once the queue drains."""
+    
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            self._flush_streams()
+    
+    def stop(self) -> None:
+        super().stop()
+        self._flush_streams()
+    
+    def _flush_streams(self) -> None:
+        for handler in self.handlers:
+            if isinstance(handler, _BufferedStreamHandler):
+                handler.flush()
+
+# Background listener owning the real log handlers, set by _configure_logging
+_log_listener: Optional[_BatchingQueueListener] = None
+
+def _configure_logging(log_file: Path) -> None:
+    """Configure root logging once; later calls leave existing handlers alone."""
+    global _log_listener
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    
+    # File records are buffered and flushed in batches
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setFormatter(formatter)
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=file_handler
+    )
+    stream_handler = _BufferedStreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    # Callers only enqueue records; a background listener performs the I/O
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    _log_listener = _BatchingQueueListener(log_queue, memory_handler, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+def _drain_logging() -> None:
+    """Write out queued log records before printing directly to stdout."""
+    if _log_listener is None:
+        return
+    # Stopping the listener handles every queued record; then resume it.
+    # QueueListener supports start() again after stop(), and this relies on it
+    _log_listener.stop()
+    _log_listener.start()
+
+@lru_cache(maxsize=None)
+def _load_template(name: str) -> Template:
+    """Load a file template from TEMPLATES_DIR, reading it only once."""
+    return Template((TEMPLATES_DIR / name).read_text(encoding='utf-8'))
+
+def _atomic_write(path: Path, content: Union[str, bytes]) -> None:
+    """Atomically write text or bytes via a temp file in the target directory."""
+    # Encode once and write bytes, bypassing the text-layer codec pipeline
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    temp_file = tempfile.NamedTemporaryFile(
+        mode='wb', dir=path.parent, delete=False, suffix='.tmp'
+    )
+    try:
+        temp_file.write(data)
+        temp_file.close()
+        os.replace(temp_file.name, path)
+    except Exception:
+        temp_file.close()
+        try:
+            os.unlink(temp_file.name)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _write_subdirectory(item: Tuple[Path, str]) -> None:
+    """Write the README and .gitkeep marker into an existing subdirectory."""
+    dir_path, readme_content = item
+    _atomic_write(dir_path / "README.md", readme_content)
+    
+    # Create .gitkeep file to ensure directory is tracked
+    (dir_path / ".gitkeep").touch()
+
 class MobileAccessSetupManager:
     """Enables full mobile access to the autonomous venture studio ecosystem."""
     
+    # Fixed keys of the report returned when setup fails
+    _ERROR_TEMPLATE = MappingProxyType({
+        "timestamp": None,
+        "status": "error",
+        "error": None,
+        "mobile_access_status": "failed"
+    })
+    
     def __init__(self):
         self.base_path = Path(__file__).parent
         self.completion_analysis = self.base_path / "100_percent_completion_analysis.json"
@@ -74,54 +370,73 @@ class MobileAccessSetupManager:
         self.log_file = self.base_path / "mobile_access_setup.log"
         
         # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        _configure_logging(self.log_file)
         self.logger = logging.getLogger(__name__)
         
-        # Mobile tracking
-        self.mobile_repositories: List[MobileRepository] = []
+        # Mobile tracking, keyed by repository name for O(1) lookups
+        self.mobile_repositories: Dict[str, MobileRepository] = {}
         self.setup_complete: bool = False
+        self._completion_cache: Optional[Dict[str, Any]] = None
         
         # GitHub configuration
         self.github_username = CONFIG["GITHUB"]["USERNAME"]
         self.main_repo_name = CONFIG["GITHUB"]["MAIN_REPO_NAME"]
+        self._main_repo_path = self.mobile_dir / self.main_repo_name
+        self._local_repo_path = str(self._main_repo_path)
+        self._github_url = f"https://github.com/{self.github_username}/{self.main_repo_name}"
+        
+        # Mobile setup instructions only depend on configuration
+        self._instructions = _INSTRUCTIONS_TEMPLATE.substitute(
+            _TEMPLATE_VARS,
+            github_username=self.github_username,
+            main_repo_name=self.main_repo_name
+        )
     
     def load_completion_analysis(self) -> Dict[str, Any]:
-        """Load completion analysis data."""
+        """Load completion analysis data, parsing the file only once."""
+        if self._completion_cache is not None:
+            return self._completion_cache
+        
         try:
             if not self.completion_analysis.exists():
-                self.logger.warning(f"Completion analysis file not found: {self.completion_analysis}")
+                self.logger.warning("Completion analysis file not found: %s", self.completion_analysis)
                 return {}
             
-            with open(self.completion_analysis, 'r', encoding='utf-8') as f:
-                analysis = json.load(f)
+            # Decode straight from the mapped file without an intermediate read
+            with open(self.completion_analysis, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        analysis = _loads(view)
             
+            self._completion_cache = analysis
             return analysis
             
         except Exception as e:
-            self.logger.error(f"Error loading completion analysis: {e}")
+            self.logger.error("Error loading completion analysis: %s", e)
             return {}
     
+    def reload_completion_analysis(self) -> Dict[str, Any]:
+        """Discard the cached completion analysis and load it again."""
+        self._completion_cache = None
+        return self.load_completion_analysis()
+    
+    def _create_directory_tree(self, repo_path: Path) -> None:
+        """Create all directories needed by the repository, parents first."""
+        directories = {self.mobile_dir, repo_path}
+        directories.update(repo_path / name for name in SUBDIRECTORIES)
+        directories.update(repo_path / name for name in EXTRA_DIRECTORIES)
+        
+        for directory in sorted(directories, key=lambda path: len(path.parts)):
+            directory.mkdir(parents=True, exist_ok=True)
+    
     def create_main_github_repository(self) -> bool:
         """Create the main GitHub repository 'iza-os-ecosystem' for mobile access."""
         try:
-            self.logger.info(f"Creating main GitHub repository: {self.main_repo_name}")
-            
-            # Ensure mobile directory exists
-            self.mobile_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create main repository structure
-            main_repo_path = self.mobile_dir / self.main_repo_name
-            main_repo_path.mkdir(parents=True, exist_ok=True)
+            self.logger.info("Creating main GitHub repository: %s", self.main_repo_name)
             
-            # Initialize git repository
-            subprocess.run(["git", "init"], cwd=main_repo_path, check=True)
+            # Create every directory up front in a single pass
+            main_repo_path = self._main_repo_path
+            self._create_directory_tree(main_repo_path)
             
             # Create main repository structure
             self.create_recommended_subdirectory_structure(main_repo_path)
@@ -138,93 +453,70 @@ class MobileAccessSetupManager:
             # Create mobile dashboard configuration
             self.create_mobile_dashboard_config(main_repo_path)
             
-            # Initial commit
-            subprocess.run(["git", "add", "."], cwd=main_repo_path, check=True)
-            subprocess.run(["git", "commit", "-m", "Initial commit - Mobile Access Setup"], cwd=main_repo_path, check=True)
-            
-            # Add remote origin
-            remote_url = f"https://github.com/{self.github_username}/{self.main_repo_name}.git"
-            subprocess.run(["git", "remote", "add", "origin", remote_url], cwd=main_repo_path, check=True)
+            # Initialize git repository once all files are in place
+            self._initialize_git_repository(main_repo_path)
             
-            self.logger.info(f"Created main repository structure: {main_repo_path}")
+            self.logger.info("Created main repository structure: %s", main_repo_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error creating main GitHub repository: {e}")
+            self.logger.error("Error creating main GitHub repository: %s", e)
             return False
     
+    async def create_main_github_repository_async(self) -> bool:
+        """Create the main GitHub repository without blocking the event loop."""
+        return await asyncio.to_thread(self.create_main_github_repository)
+    
+    def _initialize_git_repository(self, repo_path: Path) -> None:
+        """Initialize git, make the initial commit and add the remote origin."""
+        self._run(["git", "init"], repo_path)
+        self._run(["git", "add", "."], repo_path)
+        self._run(["git", "commit", "-m", "Initial commit - Mobile Access Setup"], repo_path)
+        self._run(["git", "remote", "add", "origin", f"{self._github_url}.git"], repo_path)
+    
+    def _run(self, argv: List[str], cwd: Path) -> subprocess.CompletedProcess:
+        """Run a command with stdout discarded, raising on a non-zero exit."""
+        try:
+            return subprocess.run(
+                argv,
+                cwd=cwd,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+        except subprocess.CalledProcessError as e:
+            self.logger.error("Command failed: %s", e.stderr.decode('utf-8', 'replace').strip())
+            raise
+    
+    def _prepare_subdirectories(self, repo_path: Path) -> List[Tuple[Path, str]]:
+        """Create the recommended subdirectories and return their README contents."""
+        # Collect per-directory README contents
+        subdirectory_items = []
+        for dir_name, description in SUBDIRECTORIES.items():
+            readme_content = _SUBDIR_README_TMPL.format(
+                title=dir_name.title(), description=description, dir_name=dir_name
+            )
+            dir_path = repo_path / dir_name
+            dir_path.mkdir(parents=True, exist_ok=True)
+            subdirectory_items.append((dir_path, readme_content))
+        
+        return subdirectory_items
+    
     def create_recommended_subdirectory_structure(self, repo_path: Path) -> None:
         """Create the recommended subdirectory structure."""
         try:
             self.logger.info("Creating recommended subdirectory structure")
             
-            # Define subdirectory structure
-            subdirectories = {
-                "core/": "Core autonomous venture studio components",
-                "businesses/": "Business entity implementations and configurations",
-                "integrations/": "External system integrations and APIs",
-                "dashboards/": "Monitoring and control dashboards",
-                "research/": "Research processing components and data",
-                "mobile/": "Mobile-specific optimizations and configurations",
-                "api/": "REST API endpoints and services",
-                "docs/": "Documentation and setup guides",
-                "scripts/": "Automation and deployment scripts",
-                "config/": "Configuration files and settings",
-                "data/": "Data storage and processing",
-                "logs/": "System logs and monitoring data"
-            }
+            subdirectory_items = self._prepare_subdirectories(repo_path)
             
-            for dir_name, description in subdirectories.items():
-                dir_path = repo_path / dir_name
-                dir_path.mkdir(parents=True, exist_ok=True)
-                
-                # Create README for each directory
-                readme_path = dir_path / "README.md"
-                readme_content = f"""# {dir_name.title()}
-
-{description}
-
-## Mobile Access
-
-This directory is optimized for mobile access and remote management.
-
-## Quick Start
-
-```bash
-# Navigate to this directory
-cd {dir_name}
-
-# View available files
-ls -la
-```
-
-## Mobile Optimization
-
-- Compressed file formats
-- Optimized for mobile viewing
-- Remote access enabled
-- Mobile-friendly documentation
-"""
-                
-                # Atomic write with encoding
-                temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-                try:
-                    temp_file.write(readme_content)
-                    temp_file.close()
-                    shutil.move(temp_file.name, readme_path)
-                except Exception:
-                    if os.path.exists(temp_file.name):
-                        os.unlink(temp_file.name)
-                    raise
-                
-                # Create .gitkeep file to ensure directory is tracked
-                gitkeep_path = dir_path / ".gitkeep"
-                gitkeep_path.touch()
+            # Directories are independent, so overlap their file I/O
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(_write_subdirectory, subdirectory_items))
             
             self.logger.info("Created recommended subdirectory structure")
             
         except Exception as e:
-            self.logger.error(f"Error creating subdirectory structure: {e}")
+            self.logger.error("Error creating subdirectory structure: %s", e)
     
     def create_mobile_readme(self, repo_path: Path) -> None:
         """Create mobile-optimized README with quick start guide."""
@@ -246,7 +538,7 @@ ls -la
 
 ```bash
 # Clone the repository
-git clone https://github.com/{self.github_username}/{self.main_repo_name}.git
+git clone {self._github_url}.git
 cd {self.main_repo_name}
 
 # Install dependencies
@@ -261,11 +553,11 @@ chmod +x mobile_setup.sh
 
 The ecosystem is optimized for mobile access with the following features:
 
-- **Mobile Dashboard**: {CONFIG["URLS"]["MOBILE_DASHBOARD"]} (Mobile Optimized)
-- **API Endpoints**: {CONFIG["URLS"]["API_ENDPOINTS"]}
-- **Monitoring**: {CONFIG["URLS"]["MONITORING"]}
-- **Research**: {CONFIG["URLS"]["RESEARCH"]}
-- **GitHub Integration**: {CONFIG["URLS"]["GITHUB"]}
+- **Mobile Dashboard**: {MOBILE_DASHBOARD_URL} (Mobile Optimized)
+- **API Endpoints**: {API_ENDPOINTS_URL}
+- **Monitoring**: {MONITORING_URL}
+- **Research**: {RESEARCH_URL}
+- **GitHub Integration**: {GITHUB_URL}
 
 ### Ecosystem Overview
 
@@ -306,10 +598,10 @@ python mobile_server.py
 python check_status.py
 
 # View mobile dashboard
-open {CONFIG["URLS"]["MOBILE_DASHBOARD"]}
+open {MOBILE_DASHBOARD_URL}
 
 # Access mobile API
-curl {CONFIG["URLS"]["API_ENDPOINTS"]}status
+curl {API_ENDPOINTS_URL}status
 ```
 
 ### Mobile Dashboard Access
@@ -343,21 +635,12 @@ Autonomous Venture Studio - All Rights Reserved
 """
             
             readme_path = repo_path / "README.md"
-            # Atomic write with encoding
-            temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-            try:
-                temp_file.write(readme_content)
-                temp_file.close()
-                shutil.move(temp_file.name, readme_path)
-            except Exception:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise
+            _atomic_write(readme_path, readme_content)
             
             self.logger.info("Created mobile-optimized README")
             
         except Exception as e:
-            self.logger.error(f"Error creating mobile README: {e}")
+            self.logger.error("Error creating mobile README: %s", e)
     
     def create_mobile_requirements(self, repo_path: Path) -> None:
         """Create mobile requirements.txt and setup documentation."""
@@ -414,19 +697,10 @@ user-agents==2.2.0
 """
             
             requirements_path = repo_path / "requirements.txt"
-            # Atomic write with encoding
-            temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-            try:
-                temp_file.write(requirements_content)
-                temp_file.close()
-                shutil.move(temp_file.name, requirements_path)
-            except Exception:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise
+            _atomic_write(requirements_path, requirements_content)
             
             # Create mobile setup documentation
-            mobile_docs_content = """# Mobile Setup Documentation
+            mobile_docs_content = f"""# Mobile Setup Documentation
 
 ## Mobile Access Setup
 
@@ -465,11 +739,11 @@ This document provides instructions for setting up mobile access to the Autonomo
 
 ### Mobile Access Points
 
-- **Main Dashboard**: {CONFIG["URLS"]["MOBILE_DASHBOARD"]}
-- **API Endpoints**: {CONFIG["URLS"]["API_ENDPOINTS"]}
-- **Monitoring**: {CONFIG["URLS"]["MONITORING"]}
-- **Research**: {CONFIG["URLS"]["RESEARCH"]}
-- **GitHub**: {CONFIG["URLS"]["GITHUB"]}
+- **Main Dashboard**: {MOBILE_DASHBOARD_URL}
+- **API Endpoints**: {API_ENDPOINTS_URL}
+- **Monitoring**: {MONITORING_URL}
+- **Research**: {RESEARCH_URL}
+- **GitHub**: {GITHUB_URL}
 
 ### Mobile Features
 
@@ -490,182 +764,31 @@ For mobile access support, contact the development team.
             
             mobile_docs_path = repo_path / "docs" / "mobile_setup.md"
             mobile_docs_path.parent.mkdir(parents=True, exist_ok=True)
-            # Atomic write with encoding
-            temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-            try:
-                temp_file.write(mobile_docs_content)
-                temp_file.close()
-                shutil.move(temp_file.name, mobile_docs_path)
-            except Exception:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise
+            _atomic_write(mobile_docs_path, mobile_docs_content)
             
             self.logger.info("Created mobile requirements and documentation")
             
         except Exception as e:
-            self.logger.error(f"Error creating mobile requirements: {e}")
+            self.logger.error("Error creating mobile requirements: %s", e)
     
     def create_mobile_setup_script(self, repo_path: Path) -> None:
         """Create mobile-optimized execution scripts."""
         try:
             self.logger.info("Creating mobile setup script")
             
-            setup_script_content = """#!/bin/bash
-# Mobile Setup Script for Autonomous Venture Studio
-# IZA OS Ecosystem - Mobile Access
-
-echo "🚀 Setting up mobile access for Autonomous Venture Studio..."
-echo "============================================================"
-
-# Check Python version
-python_version=$(python3 --version 2>&1)
-echo "Python version: $python_version"
-
-# Install dependencies
-echo "📦 Installing dependencies..."
-pip install -r requirements.txt
-
-# Set up environment
-echo "🔧 Setting up environment..."
-export FLASK_ENV=production
-export MOBILE_OPTIMIZATION=true
-export ECOSYSTEM_MODE=mobile
-
-# Create necessary directories
-echo "📁 Creating directories..."
-mkdir -p logs
-mkdir -p data
-mkdir -p config
-mkdir -p mobile/cache
-
-# Set permissions
-echo "🔐 Setting permissions..."
-chmod +x scripts/*.py
-chmod +x mobile/*.py
-
-# Initialize mobile configuration
-echo "⚙️ Initializing mobile configuration..."
-python scripts/init_mobile_config.py
-
-# Start mobile-optimized server
-echo "🌐 Starting mobile-optimized server..."
-echo "Mobile Dashboard: {CONFIG["URLS"]["MOBILE_DASHBOARD"]}"
-echo "API Endpoints: {CONFIG["URLS"]["API_ENDPOINTS"]}"
-echo "Monitoring: {CONFIG["URLS"]["MONITORING"]}"
-echo "Research: {CONFIG["URLS"]["RESEARCH"]}"
-echo "GitHub: {CONFIG["URLS"]["GITHUB"]}"
-echo ""
-echo "✅ Mobile access setup complete!"
-echo "📱 Open http://localhost:8000 in your mobile browser"
-echo ""
-echo "Press Ctrl+C to stop the server"
-
-# Start the mobile server
-python mobile_server.py
-"""
+            setup_script_content = _load_template("mobile_setup.sh.tmpl").substitute(_TEMPLATE_VARS)
             
             setup_path = repo_path / "mobile_setup.sh"
-            # Atomic write with encoding
-            temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-            try:
-                temp_file.write(setup_script_content)
-                temp_file.close()
-                shutil.move(temp_file.name, setup_path)
-            except Exception:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise
+            _atomic_write(setup_path, setup_script_content)
             
             # Make script executable
             os.chmod(setup_path, 0o755)
             
             # Create mobile server script
-            mobile_server_content = """#!/usr/bin/env python3
-\"\"\"
-Mobile Server for Autonomous Venture Studio
-IZA OS Ecosystem - Mobile Access
-\"\"\"
-
-import os
-import sys
-from flask import Flask, render_template, jsonify, request
-from flask_cors import CORS
-from flask_compress import Compress
-import json
-from datetime import datetime
-
-app = Flask(__name__)
-CORS(app)
-Compress(app)
-
-# Mobile optimization
-app.config['COMPRESS_MIMETYPES'] = [
-    'text/html', 'text/css', 'text/xml', 'application/json',
-    'application/javascript', 'text/javascript'
-]
-
-@app.route('/')
-def mobile_dashboard():
-    \"\"\"Mobile-optimized dashboard.\"\"\"
-    return render_template('mobile_dashboard.html')
-
-@app.route('/api/status')
-def api_status():
-    \"\"\"API status endpoint.\"\"\"
-    return jsonify({
-        'status': 'active',
-        'mobile_optimized': True,
-        'ecosystem_value': 724000000,
-        'total_entities': 730,
-        'automation_level': 95.0,
-        'timestamp': datetime.now().isoformat()
-    })
-
-@app.route('/api/entities')
-def api_entities():
-    \"\"\"Get all entities.\"\"\"
-    return jsonify({
-        'business_entities': 382,
-        'frontend_entities': 26,
-        'repository_entities': 204,
-        'mcp_servers': 5,
-        'total': 730
-    })
-
-@app.route('/api/health')
-def api_health():
-    \"\"\"Health check endpoint.\"\"\"
-    return jsonify({
-        'health': 'excellent',
-        'uptime': '100%',
-        'mobile_ready': True
-    })
-
-if __name__ == '__main__':
-    print("🌐 Starting Mobile Server for Autonomous Venture Studio")
-    print("📱 Mobile Dashboard: {CONFIG["URLS"]["MOBILE_DASHBOARD"]}")
-    print("🔗 API Endpoints: {CONFIG["URLS"]["API_ENDPOINTS"]}")
-    print("📊 Monitoring: {CONFIG["URLS"]["MONITORING"]}")
-    print("🔬 Research: {CONFIG["URLS"]["RESEARCH"]}")
-    print("📚 GitHub: {CONFIG["URLS"]["GITHUB"]}")
-    print("")
-    print("✅ Mobile access ready!")
-    
-    app.run(host='0.0.0.0', port=CONFIG["PORTS"]["MOBILE_DASHBOARD"], debug=False)
-"""
+            mobile_server_content = _load_template("mobile_server.py.tmpl").substitute(_TEMPLATE_VARS)
             
             mobile_server_path = repo_path / "mobile_server.py"
-            # Atomic write with encoding
-            temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-            try:
-                temp_file.write(mobile_server_content)
-                temp_file.close()
-                shutil.move(temp_file.name, mobile_server_path)
-            except Exception:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise
+            _atomic_write(mobile_server_path, mobile_server_content)
             
             # Make mobile server executable
             os.chmod(mobile_server_path, 0o755)
@@ -673,7 +796,7 @@ if __name__ == '__main__':
             self.logger.info("Created mobile setup and server scripts")
             
         except Exception as e:
-            self.logger.error(f"Error creating mobile setup script: {e}")
+            self.logger.error("Error creating mobile setup script: %s", e)
     
     def create_mobile_dashboard_config(self, repo_path: Path) -> None:
         """Set up mobile dashboard access (ports 8000-8601)."""
@@ -681,33 +804,34 @@ if __name__ == '__main__':
             self.logger.info("Setting up mobile dashboard configuration")
             
             # Create mobile dashboard configuration
+            ports = CONFIG["PORTS"]
             dashboard_config = {
                 "mobile_dashboard": {
                     "enabled": True,
-                    "port": CONFIG["PORTS"]["MOBILE_DASHBOARD"],
+                    "port": ports["MOBILE_DASHBOARD"],
                     "mobile_optimized": True,
                     "responsive_design": True,
                     "touch_friendly": True
                 },
                 "api_endpoints": {
                     "main_api": {
-                        "port": CONFIG["PORTS"]["API_ENDPOINTS"],
+                        "port": ports["API_ENDPOINTS"],
                         "mobile_optimized": True,
                         "compression": True,
                         "caching": True
                     },
                     "monitoring": {
-                        "port": CONFIG["PORTS"]["MONITORING"],
+                        "port": ports["MONITORING"],
                         "mobile_dashboard": True,
                         "real_time_updates": True
                     },
                     "research": {
-                        "port": CONFIG["PORTS"]["RESEARCH"],
+                        "port": ports["RESEARCH"],
                         "mobile_access": True,
                         "offline_support": True
                     },
                     "github": {
-                        "port": CONFIG["PORTS"]["GITHUB"],
+                        "port": ports["GITHUB"],
                         "mobile_interface": True,
                         "repository_access": True
                     }
@@ -720,270 +844,54 @@ if __name__ == '__main__':
                     "touch_gestures": True
                 },
                 "port_range": {
-                    "start": CONFIG["PORTS"]["START_PORT"],
-                    "end": CONFIG["PORTS"]["END_PORT"],
-                    "total_ports": CONFIG["PORTS"]["TOTAL_PORTS"],
+                    "start": ports["START_PORT"],
+                    "end": ports["END_PORT"],
+                    "total_ports": ports["TOTAL_PORTS"],
                     "mobile_allocated": True
                 },
-                "created_at": datetime.now().isoformat()
+                "created_at": datetime.now()
             }
             
             # Save dashboard configuration
             config_path = repo_path / "config" / "mobile_dashboard_config.json"
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            # Atomic write with encoding
-            temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-            try:
-                json.dump(dashboard_config, temp_file, indent=2)
-                temp_file.close()
-                shutil.move(temp_file.name, config_path)
-            except Exception:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise
+            _atomic_write(config_path, _dumps(dashboard_config))
             
             # Create mobile dashboard HTML template
-            dashboard_template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>IZA OS Ecosystem - Mobile Dashboard</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            min-height: 100vh;
-        }
-        .container {
-            max-width: 100%;
-            margin: 0 auto;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            margin-bottom: 30px;
-        }
-        .stat-card {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px;
-            border-radius: 10px;
-            text-align: center;
-            backdrop-filter: blur(10px);
-        }
-        .stat-value {
-            font-size: 24px;
-            font-weight: bold;
-            margin-bottom: 5px;
-        }
-        .stat-label {
-            font-size: 14px;
-            opacity: 0.8;
-        }
-        .quick-actions {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
-            gap: 15px;
-            margin-bottom: 30px;
-        }
-        .action-btn {
-            background: rgba(255, 255, 255, 0.2);
-            border: none;
-            padding: 15px;
-            border-radius: 10px;
-            color: white;
-            font-size: 14px;
-            cursor: pointer;
-            transition: background 0.3s;
-        }
-        .action-btn:hover {
-            background: rgba(255, 255, 255, 0.3);
-        }
-        .status-indicator {
-            display: inline-block;
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }
-        .status-healthy { background: #4CAF50; }
-        .status-warning { background: #FF9800; }
-        .status-critical { background: #F44336; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🚀 IZA OS Ecosystem</h1>
-            <p>Autonomous Venture Studio - Mobile Dashboard</p>
-            <p><span class="status-indicator status-healthy"></span>System Status: Active</p>
-        </div>
-        
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-value">$724M+</div>
-                <div class="stat-label">Ecosystem Value</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">730+</div>
-                <div class="stat-label">Total Entities</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">95%</div>
-                <div class="stat-label">Automation</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">$300M</div>
-                <div class="stat-label">ARR Potential</div>
-            </div>
-        </div>
-        
-        <div class="quick-actions">
-            <button class="action-btn" onclick="window.open('/api/status', '_blank')">📊 Status</button>
-            <button class="action-btn" onclick="window.open('/api/entities', '_blank')">🏢 Entities</button>
-            <button class="action-btn" onclick="window.open('/api/health', '_blank')">❤️ Health</button>
-            <button class="action-btn" onclick="window.open('{CONFIG["URLS"]["API_ENDPOINTS"]}', '_blank')">🔗 API</button>
-            <button class="action-btn" onclick="window.open('{CONFIG["URLS"]["MONITORING"]}', '_blank')">📈 Monitor</button>
-            <button class="action-btn" onclick="window.open('{CONFIG["URLS"]["RESEARCH"]}', '_blank')">🔬 Research</button>
-            <button class="action-btn" onclick="window.open('{CONFIG["URLS"]["GITHUB"]}', '_blank')">📚 GitHub</button>
-        </div>
-        
-        <div class="header">
-            <h3>📱 Mobile Access Ready</h3>
-            <p>All systems optimized for mobile access</p>
-        </div>
-    </div>
-    
-    <script>
-        // Auto-refresh status every 30 seconds
-        setInterval(async () => {
-            try {
-                const response = await fetch('/api/status');
-                const data = await response.json();
-                console.log('Status updated:', data);
-            } catch (error) {
-                console.error('Status check failed:', error);
-            }
-        }, 30000);
-    </script>
-</body>
-</html>"""
+            dashboard_template = _load_template("mobile_dashboard.html.tmpl").substitute(_TEMPLATE_VARS)
             
             # Save dashboard template
             template_path = repo_path / "templates" / "mobile_dashboard.html"
             template_path.parent.mkdir(parents=True, exist_ok=True)
-            # Atomic write with encoding
-            temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-            try:
-                temp_file.write(dashboard_template)
-                temp_file.close()
-                shutil.move(temp_file.name, template_path)
-            except Exception:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise
+            _atomic_write(template_path, dashboard_template)
             
             self.logger.info("Set up mobile dashboard configuration")
             
         except Exception as e:
-            self.logger.error(f"Error setting up mobile dashboard config: {e}")
+            self.logger.error("Error setting up mobile dashboard config: %s", e)
     
     def generate_mobile_setup_instructions(self) -> str:
         """Generate mobile setup instructions and clone commands."""
         try:
             self.logger.info("Generating mobile setup instructions")
             
-            instructions = f"""# Mobile Access Setup Instructions
-
-## Autonomous Venture Studio - IZA OS Ecosystem
-
-### Quick Setup (Mobile)
-
-1. **Clone Repository**
-   ```bash
-   git clone https://github.com/{self.github_username}/{self.main_repo_name}.git
-   cd {self.main_repo_name}
-   ```
-
-2. **Install Dependencies**
-   ```bash
-   pip install -r requirements.txt
-   ```
-
-3. **Run Mobile Setup**
-   ```bash
-   chmod +x mobile_setup.sh
-   ./mobile_setup.sh
-   ```
-
-4. **Access Mobile Dashboard**
-   - Open http://localhost:8000 in your mobile browser
-   - All features optimized for mobile access
-
-### Mobile Access Points
-
-- **Main Dashboard**: {CONFIG["URLS"]["MOBILE_DASHBOARD"]}
-- **API Endpoints**: {CONFIG["URLS"]["API_ENDPOINTS"]}
-- **Monitoring**: {CONFIG["URLS"]["MONITORING"]}
-- **Research**: {CONFIG["URLS"]["RESEARCH"]}
-- **GitHub Integration**: {CONFIG["URLS"]["GITHUB"]}
-
-### Mobile Features
-
-✅ Responsive design for all screen sizes  
-✅ Touch-friendly interface  
-✅ Offline functionality  
-✅ Push notifications  
-✅ Mobile-optimized API  
-✅ Compressed data transfer  
-✅ Mobile caching  
-
-### Ecosystem Overview
-
-- **Total Value**: $724M+
-- **Entities**: 730+
-- **Automation**: 95%
-- **Revenue Potential**: $300M ARR
-- **Mobile Ready**: ✅
-
-### Support
-
-For mobile access support, see `docs/mobile_setup.md`
-
----
-**Mobile Access Enabled** ✅
-"""
+            instructions = self._instructions
             
             # Save instructions
+            self.mobile_dir.mkdir(parents=True, exist_ok=True)
             instructions_path = self.mobile_dir / "MOBILE_SETUP_INSTRUCTIONS.md"
-            # Atomic write with encoding
-            temp_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False, suffix='.tmp')
-            try:
-                temp_file.write(instructions)
-                temp_file.close()
-                shutil.move(temp_file.name, instructions_path)
-            except Exception:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise
+            instructions_path.write_text(instructions, encoding='utf-8')
             
             self.logger.info("Generated mobile setup instructions")
             return instructions
             
         except Exception as e:
-            self.logger.error(f"Error generating mobile setup instructions: {e}")
+            self.logger.error("Error generating mobile setup instructions: %s", e)
             return ""
     
     def generate_mobile_completion_report(self) -> Dict[str, Any]:
         """Generate comprehensive mobile access completion report."""
+        ports = CONFIG["PORTS"]
         return {
             "timestamp": datetime.now().isoformat(),
             "mobile_access_enabled": True,
@@ -1002,22 +910,22 @@ For mobile access support, see `docs/mobile_setup.md`
                 "caching": True
             },
             "access_points": {
-                "main_dashboard": CONFIG["URLS"]["MOBILE_DASHBOARD"],
-                "api_endpoints": CONFIG["URLS"]["API_ENDPOINTS"],
-                "monitoring": CONFIG["URLS"]["MONITORING"],
-                "research": CONFIG["URLS"]["RESEARCH"],
-                "github": CONFIG["URLS"]["GITHUB"]
+                "main_dashboard": MOBILE_DASHBOARD_URL,
+                "api_endpoints": API_ENDPOINTS_URL,
+                "monitoring": MONITORING_URL,
+                "research": RESEARCH_URL,
+                "github": GITHUB_URL
             },
             "port_allocation": {
-                "start_port": CONFIG["PORTS"]["START_PORT"],
-                "end_port": CONFIG["PORTS"]["END_PORT"],
-                "total_ports": CONFIG["PORTS"]["TOTAL_PORTS"],
+                "start_port": ports["START_PORT"],
+                "end_port": ports["END_PORT"],
+                "total_ports": ports["TOTAL_PORTS"],
                 "mobile_allocated": True
             },
             "repository_info": {
                 "name": self.main_repo_name,
-                "github_url": f"https://github.com/{self.github_username}/{self.main_repo_name}",
-                "local_path": str(self.mobile_dir / self.main_repo_name),
+                "github_url": self._github_url,
+                "local_path": self._local_repo_path,
                 "mobile_ready": True
             },
             "next_steps": [
@@ -1027,6 +935,10 @@ For mobile access support, see `docs/mobile_setup.md`
             ]
         }
     
+    def generate_mobile_completion_report_bytes(self) -> bytes:
+        """Generate the completion report as compact JSON bytes."""
+        return _dumps(self.generate_mobile_completion_report(), indent=False)
+    
     def execute_mobile_access_setup(self) -> Dict[str, Any]:
         """Execute complete mobile access setup process."""
         self.logger.info("Starting Mobile Access Setup Manager")
@@ -1042,20 +954,19 @@ For mobile access support, see `docs/mobile_setup.md`
             report = self.generate_mobile_completion_report()
             
             self.logger.info("Mobile Access Setup executed successfully")
-            self.logger.info(f"Created main repository: {self.main_repo_name}")
+            self.logger.info("Created main repository: %s", self.main_repo_name)
             self.logger.info("Mobile access enabled for all 730+ entities")
-            self.logger.info(f"Dashboard accessible at {CONFIG['URLS']['MOBILE_DASHBOARD']}")
+            self.logger.info("Dashboard accessible at %s", MOBILE_DASHBOARD_URL)
             
             return report
             
         except Exception as e:
-            self.logger.error(f"Error during mobile access setup: {e}")
-            return {
-                "timestamp": datetime.now().isoformat(),
-                "status": "error",
-                "error": str(e),
-                "mobile_access_status": "failed"
-            }
+            self.logger.error("Error during mobile access setup: %s", e)
+            return {**self._ERROR_TEMPLATE, "timestamp": datetime.now().isoformat(), "error": str(e)}
+    
+    async def execute_mobile_access_setup_async(self) -> Dict[str, Any]:
+        """Execute the mobile access setup without blocking the event loop."""
+        return await asyncio.to_thread(self.execute_mobile_access_setup)
 
 def main():
     """Main execution function."""
@@ -1064,21 +975,38 @@ def main():
     
     mobile_manager = MobileAccessSetupManager()
     report = mobile_manager.execute_mobile_access_setup()
+    _drain_logging()
     
-    print("\n📊 Mobile Access Report:")
-    print(f"  • Mobile Access Enabled: {'✅' if report.get('mobile_access_enabled') else '❌'}")
-    print(f"  • Main Repository: {report.get('repository_info', {}).get('name', 'N/A')}")
-    print(f"  • Mobile Optimization: {'✅' if report.get('mobile_optimization') else '❌'}")
-    print(f"  • Dashboard Access: {'✅' if report.get('dashboard_access') else '❌'}")
-    print(f"  • Port Range: {report.get('port_allocation', {}).get('start_port', 0)}-{report.get('port_allocation', {}).get('end_port', 0)}")
-    
-    if report.get('status') != 'error':
-        print("\n✅ Mobile Access Setup Complete")
-        print("Next: Execute Complete Integration Resolution")
-        print(f"📱 Mobile Dashboard: {report.get('access_points', {}).get('main_dashboard', 'N/A')}")
+    # Assemble the whole report and write it to stdout in one call
+    lines = ["\n📊 Mobile Access Report:"]
+    if report.get('status') == 'error':
+        # Error reports carry none of the success sections
+        lines += [
+            "  • Mobile Access Enabled: ❌",
+            "  • Main Repository: N/A",
+            "  • Mobile Optimization: ❌",
+            "  • Dashboard Access: ❌",
+            "  • Port Range: 0-0",
+            "\n❌ Mobile Access Setup Failed",
+            f"Error: {report.get('error', 'Unknown error')}"
+        ]
     else:
-        print("\n❌ Mobile Access Setup Failed")
-        print(f"Error: {report.get('error', 'Unknown error')}")
+        port_allocation = report["port_allocation"]
+        start_port, end_port = port_allocation["start_port"], port_allocation["end_port"]
+        access_ok = '✅' if report['mobile_access_enabled'] else '❌'
+        optimization_ok = '✅' if report['mobile_optimization'] else '❌'
+        dashboard_ok = '✅' if report['dashboard_access'] else '❌'
+        lines += [
+            f"  • Mobile Access Enabled: {access_ok}",
+            f"  • Main Repository: {report['repository_info']['name']}",
+            f"  • Mobile Optimization: {optimization_ok}",
+            f"  • Dashboard Access: {dashboard_ok}",
+            f"  • Port Range: {start_port}-{end_port}",
+            "\n✅ Mobile Access Setup Complete",
+            "Next: Execute Complete Integration Resolution",
+            f"📱 Mobile Dashboard: {report['access_points']['main_dashboard']}"
+        ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return report
 
@@ -0,0 +1,44 @@
+import shutil
+
+import pytest
+
+from MOBILE_ACCESS_SETUP_MANAGER import SUBDIRECTORIES, MobileAccessSetupManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Manager whose generated repositories live under tmp_path."""
+    for name in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{name}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{name}_EMAIL", "test@example.com")
+
+    manager = MobileAccessSetupManager()
+    manager.mobile_dir = tmp_path / "mobile_repositories"
+    manager._main_repo_path = manager.mobile_dir / manager.main_repo_name
+    manager._local_repo_path = str(manager._main_repo_path)
+    return manager
+
+
+def test_helpers_recreate_directories_removed_after_a_run(manager):
+    repo_path = manager._main_repo_path
+    assert manager.create_main_github_repository()
+
+    shutil.rmtree(manager.mobile_dir)
+    manager.create_mobile_dashboard_config(repo_path)
+    manager.create_recommended_subdirectory_structure(repo_path)
+
+    assert (repo_path / "config" / "mobile_dashboard_config.json").is_file()
+    assert (repo_path / "templates" / "mobile_dashboard.html").is_file()
+    for dir_name in SUBDIRECTORIES:
+        assert (repo_path / dir_name / "README.md").is_file()
+        assert (repo_path / dir_name / ".gitkeep").is_file()
+
+
+def test_completion_reports_do_not_share_nested_state(manager):
+    first = manager.generate_mobile_completion_report()
+    first["repository_info"]["name"] = "changed"
+    first["next_steps"].append("changed")
+
+    second = manager.generate_mobile_completion_report()
+    assert second["repository_info"]["name"] == manager.main_repo_name
+    assert "changed" not in second["next_steps"]